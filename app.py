@@ -1,25 +1,81 @@
 import base64
+import bcrypt
+import hashlib
+import hmac
 import io
 import os
+import queue
+import re
 import secrets
 import shutil
 import sqlite3
 import tempfile
 import threading
 import time
-import datetime
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 import pyotp
 import qrcode
+from cachetools import TTLCache
 from authlib.integrations.base_client.errors import OAuthError
-from authlib.integrations.flask_client import OAuth
-from flask import Flask, render_template, request, jsonify, abort, g, session, redirect, url_for
-from functools import wraps
-from werkzeug.security import check_password_hash, generate_password_hash
+from authlib.integrations.flask_client import FlaskOAuth2App, OAuth
+from authlib.integrations.requests_client import OAuth2Session
+from flask import Flask, Response, render_template, request, jsonify, abort, g, session, redirect, url_for
+from flask.json.provider import JSONProvider
+from jinja2 import FileSystemBytecodeCache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from functools import lru_cache, wraps
+
+class OrjsonProvider(JSONProvider):
+    """Serve jsonify() and request JSON parsing through orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Compiled templates are kept on disk so restarts skip re-parsing them; see the warm-up
+# after init_db() for the in-process side.
+# Without JINJA_CACHE_DIR, Jinja picks a private per-user temp directory and checks its owner.
+JINJA_CACHE_DIR = os.environ.get("JINJA_CACHE_DIR") or None
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=JINJA_CACHE_DIR)
 app.secret_key = os.environ.get("FLASK_SECRET_KEY") or os.environ.get("SECRET_KEY") or "dev-secret-key"
 
+# Authlib opens a new requests session for every provider call (metadata, token
+# exchange, userinfo), so they share one adapter to keep TLS connections alive.
+OAUTH_HTTP_TIMEOUT = (3, 7)
+_OAUTH_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False),
+)
+
+
+class PooledOAuth2Session(OAuth2Session):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("default_timeout", OAUTH_HTTP_TIMEOUT)
+        super().__init__(*args, **kwargs)
+        self.mount("https://", _OAUTH_HTTP_ADAPTER)
+
+    def close(self):
+        # Leave the shared adapter's pool open for the next session.
+        for adapter in self.adapters.values():
+            if adapter is not _OAUTH_HTTP_ADAPTER:
+                adapter.close()
+
+
+class PooledOAuth2App(FlaskOAuth2App):
+    client_cls = PooledOAuth2Session
+
+
 oauth = OAuth()
+oauth.oauth2_client_cls = PooledOAuth2App
 oauth.init_app(app)
 
 # oauth configuration for single sign-on providers
@@ -50,26 +106,44 @@ if AUTHENTIK_BASE_URL:
         "scope": "openid email profile",
     }
 AVAILABLE_OAUTH_PROVIDERS = []
+_ENABLED_OAUTH_PROVIDERS = frozenset()
+
+
+# Clients are registered with Authlib on first use rather than at import.
+_REGISTERED_OAUTH_CLIENTS = set()
+_OAUTH_REGISTER_LOCK = threading.Lock()
 
 
 def _register_oauth_providers():
+    global _ENABLED_OAUTH_PROVIDERS
     for name, spec in OAUTH_PROVIDER_CONFIG.items():
         client_id = os.environ.get(spec["client_id_env"])
         client_secret = os.environ.get(spec["client_secret_env"])
         if not (client_id and client_secret):
             continue
+        AVAILABLE_OAUTH_PROVIDERS.append(
+            {"name": name, "display_name": spec["display_name"]}
+        )
+    _ENABLED_OAUTH_PROVIDERS = frozenset(p["name"] for p in AVAILABLE_OAUTH_PROVIDERS)
+
+
+def _ensure_registered(name: str):
+    if name in _REGISTERED_OAUTH_CLIENTS:
+        return
+    with _OAUTH_REGISTER_LOCK:
+        if name in _REGISTERED_OAUTH_CLIENTS:
+            return
+        spec = OAUTH_PROVIDER_CONFIG[name]
         client_kwargs = {"scope": spec["scope"]}
         client_kwargs.update(spec.get("client_kwargs", {}))
         oauth.register(
             name=name,
-            client_id=client_id,
-            client_secret=client_secret,
+            client_id=os.environ.get(spec["client_id_env"]),
+            client_secret=os.environ.get(spec["client_secret_env"]),
             server_metadata_url=spec["server_metadata_url"],
             client_kwargs=client_kwargs,
         )
-        AVAILABLE_OAUTH_PROVIDERS.append(
-            {"name": name, "display_name": spec["display_name"]}
-        )
+        _REGISTERED_OAUTH_CLIENTS.add(name)
 
 
 _register_oauth_providers()
@@ -86,6 +160,26 @@ DB_FILENAME = os.environ.get("PROJECT_DB", "project_manager.sqlite")
 DB_PATH = os.path.join(DATA_DIR, DB_FILENAME)
 SEED_DB_PATH = os.path.join(app.instance_path, DB_FILENAME)
 
+# Connections are kept open and reused across requests instead of being opened and
+# closed per request. At most DB_POOL_SIZE idle connections are retained.
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE") or max(4, os.cpu_count() or 1))
+DB_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-64000;
+PRAGMA foreign_keys=ON;
+PRAGMA busy_timeout=5000;
+"""
+_db_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+# Bumped whenever the database file is replaced so stale pooled connections are dropped.
+_db_pool_generation = 0
+# Set once the database file has been seeded from the packaged copy (or found to exist).
+_SEEDED = False
+# Each pooled connection keeps its own cache of compiled statements.
+DB_STATEMENT_CACHE_SIZE = 256
+
 DEFAULT_ADMIN_USERNAME = os.environ.get("DEFAULT_ADMIN_USERNAME") or "forseti"
 DEFAULT_ADMIN_PASSWORD = os.environ.get("DEFAULT_ADMIN_PASSWORD") or "flow"
 DEFAULT_ADMIN_EMAIL = os.environ.get("DEFAULT_ADMIN_EMAIL")
@@ -93,12 +187,41 @@ DEFAULT_ADMIN_PHONE = os.environ.get("DEFAULT_ADMIN_PHONE") or "0000000000"
 DEFAULT_ADMIN_COUNTRY = os.environ.get("DEFAULT_ADMIN_COUNTRY") or "1"
 MFA_ISSUER = os.environ.get("MFA_ISSUER") or "Forseti Flow"
 
+# Rendered MFA QR codes are served as PNGs from /qr/<token>. Tokens are keyed digests
+# of the secret, so reloading a setup page reuses the same URL and the browser's copy.
+_QR_CACHE = TTLCache(maxsize=1024, ttl=600)
+_QR_CACHE_LOCK = threading.Lock()
+_QR_TOKEN_KEY = secrets.token_bytes(32)
+
+# Password hashing runs on a small pool: bcrypt releases the GIL while hashing, so
+# other requests keep being served while one is waiting on a hash.
+BCRYPT_COST = int(os.environ.get("BCRYPT_COST", "12"))
+_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
 # Demo mode configuration: when enabled, the normal TOTP secret provisioning and
 # verification are bypassed in favor of a single fixed code suitable for a
 # public showcase (non-production). The database is automatically reset every 24h.
 DEMO_MODE = os.environ.get("DEMO_MODE", "0") not in {"0", "false", "False"}
 DEMO_TOTP_CODE = os.environ.get("DEMO_TOTP_CODE", "246810").strip()
 
+# Failed authentication attempts are held until this many seconds after the request
+# started, so response time does not reveal which check rejected the attempt.
+AUTH_FAILURE_DELAY = 0.25
+
+# The user count only drives page routing, so it is cached briefly and dropped
+# whenever this process inserts a user or resets the database.
+USER_COUNT_TTL = 30
+_user_count_cache = {"value": None, "ts": 0.0}
+
+# Read-only list/detail responses, stored as serialized JSON bytes keyed by
+# (table, project_id) and dropped whenever this process writes to that table for the project.
+LIST_CACHE_TTL = 30
+_LIST_CACHE = TTLCache(maxsize=4096, ttl=LIST_CACHE_TTL)
+_LIST_CACHE_LOCK = threading.Lock()
+# Token of the load currently in flight per key. Invalidation drops it, so a load that
+# raced a write is served once but not stored; entries only live while a load runs.
+_LIST_CACHE_LOADS = {}
+
 
 def _get_or_create_demo_user() -> int:
     """Ensure there is at least one demo user and return its id."""
@@ -106,30 +229,47 @@ def _get_or_create_demo_user() -> int:
     row = db.execute("SELECT id FROM users ORDER BY id LIMIT 1").fetchone()
     if row:
         return row["id"]
-    db.execute(
-        "INSERT INTO users (email, username, password_hash, phone_number, country_code, must_update_credentials, is_admin, mfa_secret) VALUES (?, ?, ?, ?, ?, 0, 1, '')",
-        (None, DEFAULT_ADMIN_USERNAME, "", "", ""),
-    )
-    db.commit()
-    row = db.execute("SELECT id FROM users ORDER BY id LIMIT 1").fetchone()
-    return row["id"]
+    with db:
+        user_id = db.execute(
+            "INSERT INTO users (email, username, password_hash, phone_number, country_code, must_update_credentials, is_admin, mfa_secret) VALUES (?, ?, ?, ?, ?, 0, 1, '') RETURNING id",
+            (None, DEFAULT_ADMIN_USERNAME, "", "", ""),
+        ).fetchone()[0]
+    _invalidate_user_count()
+    return user_id
 
 
 def _reset_database():
     """Delete and re-initialize the SQLite database (demo mode)."""
+    global _SEEDED
+    _SEEDED = False
+    with _LIST_CACHE_LOCK:
+        _LIST_CACHE.clear()
+        _LIST_CACHE_LOADS.clear()
+    _drain_db_pool()
+    _invalidate_user_count()
+    for path in (DB_PATH, f"{DB_PATH}-wal", f"{DB_PATH}-shm"):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError:
+            pass
+    # Rebuild on a private connection; no app context or pooled connection is needed.
+    ensure_db_exists()
+    fresh = not os.path.exists(DB_PATH)
+    conn = _open_db_connection()
     try:
-        if os.path.exists(DB_PATH):
-            os.remove(DB_PATH)
-    except OSError:
-        pass
-    with app.app_context():
-        init_db()
+        _migrate_schema(conn, fresh=fresh)
+    finally:
+        conn.close()
+    _SEEDED = True
+    ensure_db_permissions()
 
 
 def _needs_daily_reset() -> bool:
-    if not os.path.exists(DB_PATH):
+    try:
+        age_seconds = time.time() - os.stat(DB_PATH).st_mtime
+    except FileNotFoundError:
         return False
-    age_seconds = time.time() - os.path.getmtime(DB_PATH)
     return age_seconds > 60 * 60 * 24  # 24h
 
 
@@ -138,17 +278,27 @@ def _maybe_reset_database_for_demo():
         _reset_database()
 
 
+def _seconds_to_next_midnight() -> float:
+    # Epoch time has no leap seconds or DST, so UTC midnight is a plain modulus.
+    return 86400 - (time.time() % 86400)
+
+
 def _schedule_daily_reset():
     if not DEMO_MODE:
         return
-    def worker():
-        while True:
-            now = datetime.datetime.utcnow()
-            tomorrow = (now + datetime.timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-            delay = (tomorrow - now).total_seconds()
-            time.sleep(max(delay, 60))  # minimum sleep safeguard
+
+    def run():
+        if os.path.exists(DB_PATH):
             _reset_database()
-    threading.Thread(target=worker, name="daily-reset", daemon=True).start()
+        arm()
+
+    def arm():
+        timer = threading.Timer(max(_seconds_to_next_midnight(), 60), run)  # minimum delay safeguard
+        timer.name = "daily-reset"
+        timer.daemon = True
+        timer.start()
+
+    arm()
 
 
 def ensure_db_permissions():
@@ -173,33 +323,89 @@ def ensure_db_exists():
             pass
 
 
+# Seed and fix permissions once at boot rather than on every request.
+ensure_db_exists()
+ensure_db_permissions()
+
+
+def _open_db_connection():
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=DB_STATEMENT_CACHE_SIZE)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(DB_PRAGMAS)
+    return conn
+
+
+def _drain_db_pool():
+    """Close idle pooled connections and retire the ones currently checked out."""
+    global _db_pool_generation
+    _db_pool_generation += 1
+    while True:
+        try:
+            conn, _generation = _db_pool.get_nowait()
+        except queue.Empty:
+            return
+        conn.close()
+
+
 def get_db():
+    global _SEEDED
     if "db" not in g:
-        ensure_db_exists()
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
+        while True:
+            try:
+                conn, generation = _db_pool.get_nowait()
+            except queue.Empty:
+                conn = None
+                break
+            # close_db can re-pool a connection just as a reset retires its file.
+            if generation == _db_pool_generation:
+                break
+            conn.close()
+        if conn is None:
+            if not _SEEDED:
+                ensure_db_exists()
+            # Snapshot the generation first: a reset that lands while the file is being
+            # opened must leave this connection tagged as stale.
+            generation = _db_pool_generation
+            conn = _open_db_connection()
+            _SEEDED = True
         g.db = conn
-        ensure_db_permissions()
+        g.db_generation = generation
     return g.db
 
 
+def _bcrypt_input(password: str) -> bytes:
+    # bcrypt only looks at the first 72 bytes, so long passwords are pre-hashed.
+    return base64.b64encode(hashlib.sha256(password.encode()).digest())
+
+
+def generate_password_hash(password: str) -> str:
+    return _HASH_POOL.submit(
+        lambda: bcrypt.hashpw(_bcrypt_input(password), bcrypt.gensalt(BCRYPT_COST)).decode("ascii")
+    ).result()
+
+
+_USERNAME_STRIP_RE = re.compile(r"[^\w.\-]+")
+
+
 def _normalize_username(raw: str) -> str:
-    candidate = "".join(
-        ch for ch in (raw or "").strip().lower() if ch.isalnum() or ch in {"_", "-", "."}
-    )
+    candidate = _USERNAME_STRIP_RE.sub("", (raw or "").strip().lower())
     return candidate or "user"
 
 
 def _generate_unique_username(base: str) -> str:
     db = get_db()
+    # Fetch base and every baseN variant at once, then find the first free suffix locally.
+    rows = db.execute(
+        "SELECT username FROM users WHERE username = ? OR username GLOB ?",
+        (base, f"{base}[0-9]*"),
+    ).fetchall()
+    taken = {row["username"] for row in rows}
     username = base
     suffix = 1
-    while True:
-        exists = db.execute("SELECT 1 FROM users WHERE username = ?", (username,)).fetchone()
-        if not exists:
-            return username
+    while username in taken:
         username = f"{base}{suffix}"
         suffix += 1
+    return username
 
 
 def _create_user_from_oauth(email: str, display_name: str):
@@ -208,54 +414,105 @@ def _create_user_from_oauth(email: str, display_name: str):
     username = _generate_unique_username(base_username)
     password_hash = generate_password_hash(secrets.token_urlsafe(64))
     try:
-        cur = db.execute(
-            "INSERT INTO users (email, username, password_hash, phone_number, country_code, must_update_credentials, is_admin) VALUES (?, ?, ?, ?, ?, 0, 0)",
-            (email, username, password_hash, "", ""),
-        )
-        db.commit()
-        inserted_id = cur.lastrowid
+        with db:
+            row = db.execute(
+                """
+                INSERT INTO users (email, username, password_hash, phone_number, country_code, must_update_credentials, is_admin)
+                VALUES (?, ?, ?, ?, ?, 0, 0)
+                RETURNING id, email, username, phone_number, country_code, must_update_credentials
+                """,
+                (email, username, password_hash, "", ""),
+            ).fetchone()
+        _invalidate_user_count()
     except sqlite3.IntegrityError:
         return get_user_by_identifier(email)
-    return db.execute(
-        """
-        SELECT id, email, username, phone_number, country_code, must_update_credentials
-        FROM users WHERE id = ?
-        """,
-        (inserted_id,),
-    ).fetchone()
+    return row
 
 
 def _extract_oauth_user_info(client, token: dict) -> dict:
-    user_info = None
-    if token.get("id_token"):
-        try:
-            user_info = client.parse_id_token(token)
-        except (OAuthError, ValueError):
-            user_info = None
-    if not user_info:
-        try:
-            resp = client.get("userinfo")
-            resp.raise_for_status()
-            user_info = resp.json()
-        except Exception:
-            user_info = None
+    # authorize_access_token() has already validated the id_token (with its nonce)
+    # and stored the claims on the token, so there is no need to parse it again.
+    user_info = token.get("userinfo")
+    if isinstance(user_info, dict) and user_info:
+        return user_info
+    try:
+        resp = client.get("userinfo")
+        resp.raise_for_status()
+        user_info = resp.json()
+    except Exception:
+        user_info = None
     if isinstance(user_info, dict):
         return user_info
     return {}
 
 
+def _pad_auth_failure(started: float):
+    time.sleep(max(0.0, AUTH_FAILURE_DELAY - (time.perf_counter() - started)))
+
+
+def _is_demo_code(totp_code: str) -> bool:
+    return hmac.compare_digest(totp_code.encode(), DEMO_TOTP_CODE.encode())
+
+
 def _is_oauth_provider_enabled(provider_name: str) -> bool:
-    return any(p["name"] == provider_name for p in AVAILABLE_OAUTH_PROVIDERS)
+    return provider_name in _ENABLED_OAUTH_PROVIDERS
 
 
 def _get_available_oauth_providers() -> list[dict]:
     return list(AVAILABLE_OAUTH_PROVIDERS)
 
 
-def _get_user_count() -> int:
+def _get_user_count(fresh: bool = False) -> int:
+    now = time.monotonic()
+    cached = _user_count_cache["value"]
+    if not fresh and cached is not None and now - _user_count_cache["ts"] < USER_COUNT_TTL:
+        return cached
     db = get_db()
     row = db.execute("SELECT COUNT(*) as total FROM users").fetchone()
-    return row["total"] if row else 0
+    total = row["total"] if row else 0
+    _user_count_cache["value"] = total
+    _user_count_cache["ts"] = now
+    return total
+
+
+def _invalidate_user_count():
+    _user_count_cache["value"] = None
+
+
+def _cached_list(table: str, project_id, loader):
+    # Entries are (body, etag) so a conditional GET can be answered without re-hashing.
+    key = (table, str(project_id))
+    with _LIST_CACHE_LOCK:
+        cached = _LIST_CACHE.get(key)
+        if cached is not None:
+            return cached
+        token = _LIST_CACHE_LOADS[key] = object()
+    value = None
+    try:
+        body = loader()
+        value = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+    finally:
+        with _LIST_CACHE_LOCK:
+            if _LIST_CACHE_LOADS.get(key) is token:
+                del _LIST_CACHE_LOADS[key]
+                if value is not None:
+                    _LIST_CACHE[key] = value
+    return value
+
+
+def _json_bytes_response(cached: tuple[bytes, str]):
+    body, etag = cached
+    resp = Response(body, mimetype="application/json")
+    resp.set_etag(etag)
+    # Answers a matching If-None-Match with an empty 304.
+    return resp.make_conditional(request)
+
+
+def _invalidate_list(table: str, project_id):
+    key = (table, str(project_id))
+    with _LIST_CACHE_LOCK:
+        _LIST_CACHE.pop(key, None)
+        _LIST_CACHE_LOADS.pop(key, None)
 
 
 @app.context_processor
@@ -266,13 +523,31 @@ def inject_demo_flags():
     }
 
 
-def _generate_mfa_qr(secret: str, label: str) -> str:
-    totp = pyotp.TOTP(secret)
-    provisioning_uri = totp.provisioning_uri(name=label[:64], issuer_name=MFA_ISSUER)
+@lru_cache(maxsize=256)
+def _totp_for(secret: str) -> pyotp.TOTP:
+    return pyotp.TOTP(secret)
+
+
+@lru_cache(maxsize=128)
+def _render_mfa_qr(secret: str, label: str, issuer: str) -> bytes:
+    # The pending secret is stable across reloads of the setup pages, so the
+    # rendered PNG is memoized instead of re-encoded on every request.
+    totp = _totp_for(secret)
+    provisioning_uri = totp.provisioning_uri(name=label[:64], issuer_name=issuer)
     qr = qrcode.make(provisioning_uri)
     buffer = io.BytesIO()
     qr.save(buffer, format="PNG")
-    return f"data:image/png;base64,{base64.b64encode(buffer.getvalue()).decode('ascii')}"
+    return buffer.getvalue()
+
+
+def _generate_mfa_qr_url(secret: str, label: str) -> str:
+    png = _render_mfa_qr(secret, label, MFA_ISSUER)
+    token = hashlib.blake2b(
+        f"{secret}\0{label}".encode(), key=_QR_TOKEN_KEY, digest_size=16
+    ).hexdigest()
+    with _QR_CACHE_LOCK:
+        _QR_CACHE[token] = png
+    return url_for("mfa_qr_image", token=token)
 
 
 def _ensure_default_user(db):
@@ -280,174 +555,252 @@ def _ensure_default_user(db):
     return
 
 
-def login_required(view):
+def _make_login_required(unauthenticated, needs_update):
     exempt_endpoints = {"account_page", "logout"}
 
-    @wraps(view)
-    def wrapped(*args, **kwargs):
-        if session.get("user_id") is None:
-            if request.path.startswith("/api/"):
-                return jsonify({"error": "authentication required"}), 401
-            return redirect(url_for("login_page"))
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            if session.get("user_id") is None:
+                return unauthenticated()
+            if session.get("needs_update") and request.endpoint not in exempt_endpoints:
+                return needs_update()
+            return view(*args, **kwargs)
+
+        return wrapped
 
-        if session.get("needs_update"):
-            endpoint = request.endpoint or ""
-            if endpoint not in exempt_endpoints:
-                if request.path.startswith("/api/"):
-                    return jsonify({"error": "update credentials required"}), 403
-                return redirect(url_for("account_page"))
+    return decorator
 
-        return view(*args, **kwargs)
 
-    return wrapped
+# Page and API routes fail differently; the variant is picked where each route is declared.
+login_required_html = _make_login_required(
+    lambda: redirect(url_for("login_page")),
+    lambda: redirect(url_for("account_page")),
+)
+login_required_api = _make_login_required(
+    lambda: (jsonify({"error": "authentication required"}), 401),
+    lambda: (jsonify({"error": "update credentials required"}), 403),
+)
 
 
 @app.teardown_appcontext
 def close_db(error=None):
     db = g.pop("db", None)
-    if db is not None:
+    if db is None:
+        return
+    generation = g.pop("db_generation", None)
+    # Drop any transaction left open by the request before the connection is reused.
+    db.rollback()
+    if generation != _db_pool_generation:
+        db.close()
+        return
+    try:
+        _db_pool.put_nowait((db, generation))
+    except queue.Full:
         db.close()
 
 
+# Per-project list queries filter on project_id and order by id.
+_PROJECT_LIST_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_tasks_proj ON tasks(project_id, id)",
+    "CREATE INDEX IF NOT EXISTS idx_backlogs_proj ON backlogs(project_id, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_sprints_proj ON sprints(project_id, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_resources_proj ON resources(project_id, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_parent ON tasks(parent_id)",
+]
+
+# Base schema, created in a single executescript() round trip. Brand-new databases run it
+# with _PROJECT_LIST_INDEXES and are stamped straight to SCHEMA_VERSION, so it must describe
+# the latest tables. The indexes stay out of it: a pre-versioning file may still lack the
+# columns they cover until migration 2 has added them.
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS projects (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        description TEXT DEFAULT ''
+    );
+    CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        project_id INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT DEFAULT '',
+        status TEXT NOT NULL DEFAULT 'todo',
+        due_date TEXT DEFAULT '',
+        resource_id INTEGER DEFAULT NULL,
+        parent_id INTEGER DEFAULT NULL,
+        FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE
+    );
+    CREATE TABLE IF NOT EXISTS backlogs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        project_id INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        priority TEXT NOT NULL DEFAULT 'medium',
+        status TEXT NOT NULL DEFAULT 'todo',
+        tags TEXT DEFAULT '',
+        resource_id INTEGER DEFAULT NULL,
+        parent_id INTEGER DEFAULT NULL,
+        FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE
+    );
+    CREATE TABLE IF NOT EXISTS sprints (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        project_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'planned',
+        start_date TEXT DEFAULT '',
+        end_date TEXT DEFAULT '',
+        velocity INTEGER DEFAULT 0,
+        scope_points INTEGER DEFAULT 0,
+        done_points INTEGER DEFAULT 0,
+        notes TEXT DEFAULT '',
+        FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE
+    );
+    CREATE TABLE IF NOT EXISTS resources (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        project_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'free',
+        notes TEXT DEFAULT '',
+        FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE
+    );
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT UNIQUE,
+        username TEXT NOT NULL UNIQUE,
+        password_hash TEXT NOT NULL,
+        phone_number TEXT NOT NULL,
+        country_code TEXT NOT NULL,
+        must_update_credentials INTEGER NOT NULL DEFAULT 0,
+        is_admin INTEGER NOT NULL DEFAULT 0,
+        mfa_secret TEXT DEFAULT '',
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+_PROJECT_LIST_INDEXES_SQL = "".join(f"{stmt};\n" for stmt in _PROJECT_LIST_INDEXES)
+
+# Schema migrations keyed by the PRAGMA user_version they bring the database up to.
+# Plain strings are executed as-is; (table, column, declaration) tuples add a column
+# that databases created before versioning may already have.
+SCHEMA_VERSION = 5
+MIGRATIONS = {
+    2: [
+        ("tasks", "parent_id", "INTEGER DEFAULT NULL"),
+        ("tasks", "description", "TEXT DEFAULT ''"),
+        ("tasks", "resource_id", "INTEGER DEFAULT NULL"),
+        ("backlogs", "parent_id", "INTEGER DEFAULT NULL"),
+        ("backlogs", "resource_id", "INTEGER DEFAULT NULL"),
+    ],
+    3: [
+        ("users", "username", "TEXT"),
+        "UPDATE users SET username = email WHERE username IS NULL",
+        ("users", "must_update_credentials", "INTEGER NOT NULL DEFAULT 0"),
+        ("users", "is_admin", "INTEGER NOT NULL DEFAULT 0"),
+        ("users", "mfa_secret", "TEXT DEFAULT ''"),
+        "UPDATE users SET must_update_credentials = 0 WHERE must_update_credentials IS NULL",
+    ],
+    # Emails are stored lowercased so lookups can use the UNIQUE index on users.email.
+    4: [
+        "UPDATE OR IGNORE users SET email = LOWER(email) WHERE email IS NOT NULL AND email <> LOWER(email)",
+    ],
+    5: list(_PROJECT_LIST_INDEXES),
+}
+
+
+def _columns(db, table: str) -> set[str]:
+    return {row["name"] for row in db.execute(f"PRAGMA table_info({table})")}
+
+
+def _apply_migration_step(db, step, columns: dict):
+    if isinstance(step, str):
+        db.execute(step)
+        return
+    table, column, declaration = step
+    if table not in columns:
+        columns[table] = _columns(db, table)
+    if column not in columns[table]:
+        db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+        columns[table].add(column)
+
+
+def _migrate_schema(db, fresh: bool = False):
+    if fresh:
+        # A new, empty file gets the base schema and is stamped current in one script;
+        # the column migrations only exist for databases that predate those columns.
+        db.executescript(
+            f"BEGIN;{_SCHEMA_SQL}{_PROJECT_LIST_INDEXES_SQL}PRAGMA user_version = {SCHEMA_VERSION};COMMIT;"
+        )
+        return
+    cur_ver = db.execute("PRAGMA user_version").fetchone()[0]
+    if cur_ver < 1:
+        db.executescript("BEGIN;" + _SCHEMA_SQL + "COMMIT;")
+    if cur_ver < SCHEMA_VERSION:
+        # Each table is introspected once and every pending step commits together,
+        # so the schema cookie only changes once.
+        columns = {}
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            for version in range(max(cur_ver, 1) + 1, SCHEMA_VERSION + 1):
+                for step in MIGRATIONS[version]:
+                    _apply_migration_step(db, step, columns)
+            db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except Exception:
+            db.rollback()
+            raise
+        db.commit()
+
+
 def init_db():
     db = get_db()
-    db.execute(
-        """
-        CREATE TABLE IF NOT EXISTS projects (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            description TEXT DEFAULT ''
-        )
-        """
-    )
-    db.execute(
-        """
-        CREATE TABLE IF NOT EXISTS tasks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            project_id INTEGER NOT NULL,
-            title TEXT NOT NULL,
-            description TEXT DEFAULT '',
-            status TEXT NOT NULL DEFAULT 'todo',
-            due_date TEXT DEFAULT '',
-            resource_id INTEGER DEFAULT NULL,
-            parent_id INTEGER DEFAULT NULL,
-            FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE
-        )
-        """
-    )
-    db.execute(
-        """
-        CREATE TABLE IF NOT EXISTS backlogs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            project_id INTEGER NOT NULL,
-            title TEXT NOT NULL,
-            priority TEXT NOT NULL DEFAULT 'medium',
-            status TEXT NOT NULL DEFAULT 'todo',
-            tags TEXT DEFAULT '',
-            resource_id INTEGER DEFAULT NULL,
-            parent_id INTEGER DEFAULT NULL,
-            FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE
-        )
-        """
-    )
-    db.execute(
-        """
-        CREATE TABLE IF NOT EXISTS sprints (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            project_id INTEGER NOT NULL,
-            name TEXT NOT NULL,
-            status TEXT NOT NULL DEFAULT 'planned',
-            start_date TEXT DEFAULT '',
-            end_date TEXT DEFAULT '',
-            velocity INTEGER DEFAULT 0,
-            scope_points INTEGER DEFAULT 0,
-            done_points INTEGER DEFAULT 0,
-            notes TEXT DEFAULT '',
-            FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE
-        )
-        """
-    )
-    db.execute(
-        """
-        CREATE TABLE IF NOT EXISTS resources (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            project_id INTEGER NOT NULL,
-            name TEXT NOT NULL,
-            status TEXT NOT NULL DEFAULT 'free',
-            notes TEXT DEFAULT '',
-            FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE
-        )
-        """
-    )
-    db.execute(
-        """
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            email TEXT UNIQUE,
-            username TEXT NOT NULL UNIQUE,
-            password_hash TEXT NOT NULL,
-            phone_number TEXT NOT NULL,
-            country_code TEXT NOT NULL,
-            must_update_credentials INTEGER NOT NULL DEFAULT 0,
-            is_admin INTEGER NOT NULL DEFAULT 0,
-            mfa_secret TEXT DEFAULT '',
-            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-        )
-        """
-    )
-    try:
-        db.execute("ALTER TABLE tasks ADD COLUMN parent_id INTEGER DEFAULT NULL")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        db.execute("ALTER TABLE tasks ADD COLUMN description TEXT DEFAULT ''")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        db.execute("ALTER TABLE backlogs ADD COLUMN parent_id INTEGER DEFAULT NULL")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        db.execute("ALTER TABLE tasks ADD COLUMN resource_id INTEGER DEFAULT NULL")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        db.execute("ALTER TABLE backlogs ADD COLUMN resource_id INTEGER DEFAULT NULL")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        db.execute("ALTER TABLE users ADD COLUMN username TEXT UNIQUE")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        db.execute("UPDATE users SET username = email WHERE username IS NULL")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        db.execute("ALTER TABLE users ADD COLUMN must_update_credentials INTEGER NOT NULL DEFAULT 0")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        db.execute("ALTER TABLE users ADD COLUMN is_admin INTEGER NOT NULL DEFAULT 0")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        db.execute("ALTER TABLE users ADD COLUMN mfa_secret TEXT DEFAULT ''")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        db.execute("UPDATE users SET must_update_credentials = 0 WHERE must_update_credentials IS NULL")
-    except sqlite3.OperationalError:
-        pass
-    db.commit()
+    _migrate_schema(db)
     _ensure_default_user(db)
+    # Refresh planner statistics so the project_id and users indexes are chosen.
+    db.execute("ANALYZE")
     db.commit()
 
+# The schema is created once at import; routes never call init_db().
 with app.app_context():
     init_db()
+# init_db may have just created the file, so apply its permissions now.
+ensure_db_permissions()
+
+# Load every page template up front so the first request to each doesn't compile it.
+for _template_name in app.jinja_env.list_templates(extensions=["html"]):
+    app.jinja_env.get_template(_template_name)
+
+
+# Accepted values for the status/priority fields of project items.
+TASK_STATUSES = frozenset({"todo", "in-progress", "done", "later"})
+BACKLOG_PRIORITIES = frozenset({"high", "medium", "low"})
+BACKLOG_STATUSES = frozenset({"in-progress", "todo", "later"})
+SPRINT_STATUSES = frozenset({"planned", "active", "done"})
+RESOURCE_STATUSES = frozenset({"free", "overloaded", "holiday"})
 
 
-def require_project(project_id: str):
+def _get_str(data: dict, key: str, default: str = "") -> str:
+    return (data.get(key) or default).strip()
+
+
+def _get_enum(data: dict, key: str, allowed: frozenset, default: str | None = None):
+    value = data.get(key)
+    # The frontend sends canonical values, so try them before normalizing.
+    if isinstance(value, str) and value in allowed:
+        return value
+    value = _get_str(data, key).lower()
+    return value if value in allowed else default
+
+
+_TAG_SEPARATOR_RE = re.compile(r"\s*,\s*")
+
+
+def _get_tags(data: dict) -> str:
+    return ",".join(filter(None, _TAG_SEPARATOR_RE.split((data.get("tags") or "").strip())))
+
+
+def _get_parent_id(data: dict):
+    parent_id = data.get("parent_id")
+    return None if parent_id in ("", None) else parent_id
+
+
+def require_project(project_id: int):
     db = get_db()
     row = db.execute(
         "SELECT id, name, description FROM projects WHERE id = ?", (project_id,)
@@ -457,15 +810,146 @@ def require_project(project_id: str):
     return dict(row)
 
 
+# Per-entity insert values (after project_id), shared by the single and bulk create routes.
+TASK_INSERT_COLUMNS = ("title", "description", "status", "due_date", "parent_id")
+BACKLOG_INSERT_COLUMNS = ("title", "priority", "status", "tags", "parent_id")
+SPRINT_INSERT_COLUMNS = ("name", "status", "start_date", "end_date", "velocity", "scope_points", "done_points", "notes")
+RESOURCE_INSERT_COLUMNS = ("name", "status", "notes")
+
+
+def _task_values(data: dict) -> tuple:
+    title = _get_str(data, "title")
+    if not title:
+        abort(400, "Task title is required.")
+    # Single-user mode: ignore assignee/resource
+    return (
+        title,
+        _get_str(data, "description"),
+        _get_enum(data, "status", TASK_STATUSES, "todo"),
+        _get_str(data, "due_date"),
+        _get_parent_id(data),
+    )
+
+
+def _backlog_values(data: dict) -> tuple:
+    title = _get_str(data, "title")
+    if not title:
+        abort(400, "Title is required.")
+    # Single-user mode: ignore assignee/resource
+    return (
+        title,
+        _get_enum(data, "priority", BACKLOG_PRIORITIES, "medium"),
+        _get_enum(data, "status", BACKLOG_STATUSES, "todo"),
+        _get_tags(data),
+        _get_parent_id(data),
+    )
+
+
+def _sprint_values(data: dict) -> tuple:
+    name = _get_str(data, "name")
+    if not name:
+        abort(400, "Sprint name is required.")
+    return (
+        name,
+        _get_enum(data, "status", SPRINT_STATUSES, "planned"),
+        _get_str(data, "start_date"),
+        _get_str(data, "end_date"),
+        int(data.get("velocity") or 0),
+        int(data.get("scope_points") or 0),
+        int(data.get("done_points") or 0),
+        _get_str(data, "notes"),
+    )
+
+
+def _resource_values(data: dict) -> tuple:
+    name = _get_str(data, "name")
+    if not name:
+        abort(400, "Resource name is required.")
+    return (
+        name,
+        _get_enum(data, "status", RESOURCE_STATUSES, "free"),
+        _get_str(data, "notes"),
+    )
+
+
+# Opt-in keyset pagination for the newest-first list routes (?limit=&cursor=).
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def _wants_page() -> bool:
+    return "limit" in request.args or "cursor" in request.args
+
+
+def _keyset_page(table: str, columns: str, project_id: int | None = None):
+    try:
+        limit = min(max(int(request.args.get("limit") or DEFAULT_PAGE_SIZE), 1), MAX_PAGE_SIZE)
+        cursor = request.args.get("cursor")
+        cursor = int(cursor) if cursor else None
+    except ValueError:
+        abort(400, "limit and cursor must be integers.")
+    clauses = []
+    params = []
+    if project_id is not None:
+        clauses.append("project_id = ?")
+        params.append(project_id)
+    if cursor is not None:
+        clauses.append("id < ?")
+        params.append(cursor)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    # One extra row tells whether another page exists without handing out an empty one.
+    rows = get_db().execute(
+        f"SELECT {columns} FROM {table}{where} ORDER BY id DESC LIMIT ?", (*params, limit + 1)
+    ).fetchall()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = rows[-1]["id"] if has_more else None
+    return jsonify({"items": [dict(r) for r in rows], "next_cursor": next_cursor})
+
+
+# Upper bound on one bulk request, so a single batch can't hold the write lock indefinitely.
+MAX_BULK_ITEMS = 500
+
+
+def _bulk_create(table: str, columns: tuple, project_id: int, parse_item):
+    items = request.get_json(silent=True)
+    if not isinstance(items, list) or not items:
+        abort(400, "Expected a non-empty JSON array.")
+    if len(items) > MAX_BULK_ITEMS:
+        abort(413, f"At most {MAX_BULK_ITEMS} items can be created per request.")
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            abort(400, f"Item {index} must be a JSON object.")
+    rows = [(project_id, *parse_item(item)) for item in items]
+    placeholders = ", ".join("?" for _ in range(len(columns) + 1))
+    db = get_db()
+    # One transaction for the whole batch; the write lock keeps the new ids contiguous.
+    try:
+        with db:
+            cur = db.executemany(
+                f"INSERT INTO {table} (project_id, {', '.join(columns)}) VALUES ({placeholders})", rows
+            )
+            last_id = db.execute("SELECT last_insert_rowid()").fetchone()[0]
+    except sqlite3.IntegrityError:
+        abort(404, "Project not found.")
+    _invalidate_list(table, project_id)
+    return jsonify({"ids": list(range(last_id - cur.rowcount + 1, last_id + 1))}), 201
+
+
 def get_user_by_identifier(identifier: str):
     db = get_db()
+    # Emails are stored lowercased, so each branch is a single probe on a UNIQUE index.
+    if "@" in (identifier or ""):
+        column, value = "email", identifier.strip().lower()
+    else:
+        column, value = "username", identifier
     return db.execute(
-        """
+        f"""
         SELECT id, email, username, password_hash, phone_number, country_code, must_update_credentials, mfa_secret
         FROM users
-        WHERE username = ? OR (email IS NOT NULL AND LOWER(email) = LOWER(?))
+        WHERE {column} = ?
         """,
-        (identifier, identifier),
+        (value,),
     ).fetchone()
 
 
@@ -482,7 +966,6 @@ def get_user_by_id(user_id: int):
 
 
 def render_login_view():
-    init_db()
     oauth_error = session.pop("oauth_error", None)
     allow_registration = _get_user_count() == 0
     # If no users exist, generate a pending MFA secret and QR for setup
@@ -490,16 +973,16 @@ def render_login_view():
     if allow_registration and not pending_mfa_secret:
         pending_mfa_secret = pyotp.random_base32()
         session["pending_mfa_secret"] = pending_mfa_secret
-    mfa_qr = None
+    mfa_qr_url = None
     if allow_registration and pending_mfa_secret:
         label = DEFAULT_ADMIN_USERNAME
-        mfa_qr = _generate_mfa_qr(pending_mfa_secret, label)
+        mfa_qr_url = _generate_mfa_qr_url(pending_mfa_secret, label)
     return render_template(
         "login.html",
         oauth_providers=_get_available_oauth_providers(),
         oauth_error=oauth_error,
         allow_registration=allow_registration,
-        mfa_qr=mfa_qr,
+        mfa_qr_url=mfa_qr_url,
     )
 
 
@@ -515,7 +998,7 @@ def login_page():
             oauth_providers=[],
             oauth_error=None,
             allow_registration=False,
-            mfa_qr=None,
+            mfa_qr_url=None,
             demo_code=DEMO_TOTP_CODE,
         )
     if _get_user_count() == 0:
@@ -524,7 +1007,6 @@ def login_page():
 
 @app.route("/setup")
 def setup_page():
-    init_db()
     if DEMO_MODE or _get_user_count():
         return redirect(url_for("login_page"))
     # Ensure a pending secret and QR are available
@@ -532,14 +1014,23 @@ def setup_page():
     if not pending_mfa_secret:
         pending_mfa_secret = pyotp.random_base32()
         session["pending_mfa_secret"] = pending_mfa_secret
-    mfa_qr = _generate_mfa_qr(pending_mfa_secret, DEFAULT_ADMIN_USERNAME)
-    return render_template("setup.html", mfa_qr=mfa_qr)
+    mfa_qr_url = _generate_mfa_qr_url(pending_mfa_secret, DEFAULT_ADMIN_USERNAME)
+    return render_template("setup.html", mfa_qr_url=mfa_qr_url)
+
+
+@app.route("/qr/<token>")
+def mfa_qr_image(token: str):
+    with _QR_CACHE_LOCK:
+        png = _QR_CACHE.get(token)
+    if png is None:
+        abort(404)
+    return Response(png, mimetype="image/png", headers={"Cache-Control": "private, max-age=60"})
 
 
 @app.route("/register", methods=["GET", "POST"])
 def register_page():
-    init_db()
-    if _get_user_count():
+    # Registration creates an admin account, so never trust a cached count here.
+    if _get_user_count(fresh=request.method == "POST"):
         return redirect(url_for("login_page"))
     error = None
     if request.method == "POST":
@@ -560,11 +1051,12 @@ def register_page():
             password_hash = generate_password_hash(password)
             db = get_db()
             try:
-                cur = db.execute(
-                    "INSERT INTO users (email, username, password_hash, phone_number, country_code, must_update_credentials, is_admin) VALUES (?, ?, ?, ?, ?, 0, 1)",
-                    (email or None, username, password_hash, phone_number, country_code),
-                )
-                db.commit()
+                with db:
+                    cur = db.execute(
+                        "INSERT INTO users (email, username, password_hash, phone_number, country_code, must_update_credentials, is_admin) VALUES (?, ?, ?, ?, ?, 0, 1)",
+                        (email or None, username, password_hash, phone_number, country_code),
+                    )
+                _invalidate_user_count()
                 user = get_user_by_id(cur.lastrowid)
                 if user:
                     session["user_id"] = user["id"]
@@ -577,9 +1069,8 @@ def register_page():
 
 
 @app.route("/app")
-@login_required
+@login_required_html
 def index_page():
-    init_db()
     return render_template("index.html")
 
 
@@ -593,6 +1084,7 @@ def logout():
 def oauth_login(provider: str):
     if not _is_oauth_provider_enabled(provider):
         abort(404)
+    _ensure_registered(provider)
     client = oauth.create_client(provider)
     if client is None:
         abort(404)
@@ -602,8 +1094,10 @@ def oauth_login(provider: str):
 
 @app.route("/auth/oauth/<provider>/callback")
 def oauth_callback(provider: str):
+    started = time.perf_counter()
     if not _is_oauth_provider_enabled(provider):
         abort(404)
+    _ensure_registered(provider)
     client = oauth.create_client(provider)
     if client is None:
         abort(404)
@@ -611,16 +1105,18 @@ def oauth_callback(provider: str):
         token = client.authorize_access_token()
     except OAuthError as exc:
         session["oauth_error"] = str(exc)
+        _pad_auth_failure(started)
         return redirect(url_for("login_page"))
     except Exception:
         session["oauth_error"] = "Unable to complete the external authentication flow."
+        _pad_auth_failure(started)
         return redirect(url_for("login_page"))
 
-    init_db()
     user_info = _extract_oauth_user_info(client, token)
     email = (user_info.get("email") or "").strip().lower()
     if not email:
         session["oauth_error"] = "External provider did not supply an email address."
+        _pad_auth_failure(started)
         return redirect(url_for("login_page"))
 
     user = get_user_by_identifier(email)
@@ -628,6 +1124,7 @@ def oauth_callback(provider: str):
         user = _create_user_from_oauth(email, user_info.get("name") or user_info.get("preferred_username") or "")
     if not user:
         session["oauth_error"] = "Unable to create or load a user account."
+        _pad_auth_failure(started)
         return redirect(url_for("login_page"))
 
     session["user_id"] = user["id"]
@@ -639,7 +1136,7 @@ def oauth_callback(provider: str):
 
 
 @app.route("/account", methods=["GET", "POST"])
-@login_required
+@login_required_html
 def account_page():
     user = get_user_by_id(session["user_id"])
     if not user:
@@ -653,13 +1150,13 @@ def account_page():
     if mfa_setup_required and not pending_mfa_secret:
         pending_mfa_secret = pyotp.random_base32()
         session["pending_mfa_secret"] = pending_mfa_secret
-    mfa_qr = None
+    mfa_qr_url = None
     if mfa_setup_required and pending_mfa_secret:
         label = (user["email"] or user["username"] or DEFAULT_ADMIN_USERNAME)
-        mfa_qr = _generate_mfa_qr(pending_mfa_secret, label)
+        mfa_qr_url = _generate_mfa_qr_url(pending_mfa_secret, label)
     if request.method == "POST":
         username = (request.form.get("username") or "").strip()
-        email = (request.form.get("email") or "").strip()
+        email = (request.form.get("email") or "").strip().lower()
         password = request.form.get("password") or ""
         confirm_password = request.form.get("confirm_password") or ""
         totp_code = (request.form.get("totp_code") or "").strip()
@@ -694,7 +1191,7 @@ def account_page():
                 elif not totp_code:
                     error = "Enter the authenticator code from your authenticator app."
                     mfa_ready = False
-                elif not pyotp.TOTP(pending_mfa_secret).verify(totp_code, valid_window=1):
+                elif not _totp_for(pending_mfa_secret).verify(totp_code, valid_window=1):
                     error = "Invalid authenticator code."
                     mfa_ready = False
                 else:
@@ -703,8 +1200,11 @@ def account_page():
             if updates and mfa_ready:
                 try:
                     db = get_db()
-                    db.execute(f"UPDATE users SET {', '.join(updates)} WHERE id = ?", tuple(values))
-                    db.commit()
+                    with db:
+                        db.execute(f"UPDATE users SET {', '.join(updates)} WHERE id = ?", tuple(values))
+                    if mfa_setup_required:
+                        # Drop TOTP objects built for the secret that was just rotated in.
+                        _totp_for.cache_clear()
                     session.pop("needs_update", None)
                     session.pop("pending_mfa_secret", None)
                     return redirect(url_for("index_page"))
@@ -716,25 +1216,24 @@ def account_page():
         error=error,
         requires_update=user["must_update_credentials"],
         mfa_setup_required=mfa_setup_required,
-        mfa_qr=mfa_qr,
+        mfa_qr_url=mfa_qr_url,
         mfa_secret=pending_mfa_secret,
     )
 
 
 @app.route("/api/users", methods=["POST"])
 def create_user():
-    init_db()
     db = get_db()
     user_count = db.execute("SELECT COUNT(*) as total FROM users").fetchone()["total"]
     if user_count and session.get("user_id") is None:
         abort(401, "Must be signed in to add new users.")
 
     data = request.get_json(silent=True) or {}
-    username = (data.get("username") or "").strip()
-    email = (data.get("email") or "").strip().lower()
-    password = (data.get("password") or "").strip()
-    phone_number = (data.get("phone_number") or "").strip()
-    country_code = (data.get("country_code") or "").strip()
+    username = _get_str(data, "username")
+    email = _get_str(data, "email").lower()
+    password = _get_str(data, "password")
+    phone_number = _get_str(data, "phone_number")
+    country_code = _get_str(data, "country_code")
     custom_force = bool(data.get("force_password_change") or data.get("force_update"))
     is_first_user = user_count == 0
     force_update = False if is_first_user else custom_force
@@ -745,43 +1244,50 @@ def create_user():
             400,
             "Username, password, phone number, and country code are required.",
         )
+    # Reject known duplicates before paying for the hash; the UNIQUE constraints still
+    # catch a concurrent insert below.
+    if db.execute(
+        "SELECT 1 FROM users WHERE username = ? OR email = ?", (username, email or None)
+    ).fetchone():
+        abort(409, "A user with that username or email already exists.")
 
     password_hash = generate_password_hash(password)
     try:
-        cur = db.execute(
-            "INSERT INTO users (email, username, password_hash, phone_number, country_code, must_update_credentials, is_admin) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (
-                email or None,
-                username,
-                password_hash,
-                phone_number,
-                country_code,
-                int(force_update),
-                is_admin,
-            ),
-        )
-        db.commit()
+        with db:
+            user_id = db.execute(
+                "INSERT INTO users (email, username, password_hash, phone_number, country_code, must_update_credentials, is_admin) VALUES (?, ?, ?, ?, ?, ?, ?) RETURNING id",
+                (
+                    email or None,
+                    username,
+                    password_hash,
+                    phone_number,
+                    country_code,
+                    int(force_update),
+                    is_admin,
+                ),
+            ).fetchone()["id"]
+        _invalidate_user_count()
     except sqlite3.IntegrityError:
         abort(409, "A user with that username or email already exists.")
 
-    return jsonify({"id": cur.lastrowid, "username": username, "email": email}), 201
+    return jsonify({"id": user_id, "username": username, "email": email}), 201
 
 
 @app.route("/api/auth/start", methods=["POST"])
 def start_login():
-    init_db()
     # Deprecated: password-based login removed. Keep endpoint but fail clearly.
     abort(400, "Password login is disabled. Use TOTP-only login.")
 
 @app.route("/api/auth/totp-login", methods=["POST"])
 def totp_login():
-    init_db()
+    started = time.perf_counter()
     data = request.get_json(silent=True) or {}
-    totp_code = (data.get("totp_code") or "").strip()
+    totp_code = _get_str(data, "totp_code")
     if not totp_code:
         abort(400, "Authenticator code is required.")
     if DEMO_MODE:
-        if totp_code != DEMO_TOTP_CODE:
+        if not _is_demo_code(totp_code):
+            _pad_auth_failure(started)
             abort(401, "Invalid demo code.")
         session["user_id"] = _get_or_create_demo_user()
         session.pop("needs_update", None)
@@ -789,12 +1295,14 @@ def totp_login():
     db = get_db()
     row = db.execute("SELECT id, mfa_secret, must_update_credentials FROM users ORDER BY id LIMIT 1").fetchone()
     if not row:
+        _pad_auth_failure(started)
         abort(404, "No user configured. Set up the authenticator first.")
     secret = row["mfa_secret"] or ""
     if not secret:
+        _pad_auth_failure(started)
         abort(409, "Authenticator not configured. Open the account page to set it up.")
-    totp = pyotp.TOTP(secret)
-    if not totp.verify(totp_code, valid_window=1):
+    if not _totp_for(secret).verify(totp_code, valid_window=1):
+        _pad_auth_failure(started)
         abort(401, "Invalid authenticator code.")
     session["user_id"] = row["id"]
     if bool(row["must_update_credentials"]):
@@ -807,14 +1315,15 @@ def totp_login():
 
 @app.route("/api/auth/setup-first", methods=["POST"])
 def setup_first_user():
-    init_db()
+    started = time.perf_counter()
     db = get_db()
     count = db.execute("SELECT COUNT(*) as total FROM users").fetchone()["total"]
     if DEMO_MODE:
         # In demo mode the first user is auto-created with the demo code.
         data = request.get_json(silent=True) or {}
-        totp_code = (data.get("totp_code") or "").strip()
-        if totp_code != DEMO_TOTP_CODE:
+        totp_code = _get_str(data, "totp_code")
+        if not _is_demo_code(totp_code):
+            _pad_auth_failure(started)
             abort(401, "Invalid demo code.")
         user_id = _get_or_create_demo_user()
         session["user_id"] = user_id
@@ -822,7 +1331,7 @@ def setup_first_user():
     if count:
         abort(409, "User already exists.")
     data = request.get_json(silent=True) or {}
-    totp_code = (data.get("totp_code") or "").strip()
+    totp_code = _get_str(data, "totp_code")
     pending_secret = session.get("pending_mfa_secret") or ""
     if not pending_secret:
         # Generate and hold a secret for setup flow
@@ -831,393 +1340,338 @@ def setup_first_user():
         abort(409, "Setup secret generated. Refresh and scan the QR, then submit the code.")
     if not totp_code:
         abort(400, "Enter the authenticator code from your app.")
-    if not pyotp.TOTP(pending_secret).verify(totp_code, valid_window=1):
+    if not _totp_for(pending_secret).verify(totp_code, valid_window=1):
         abort(401, "Invalid authenticator code.")
     # Create a single admin user with no password requirements
-    db.execute(
-        "INSERT INTO users (email, username, password_hash, phone_number, country_code, must_update_credentials, is_admin, mfa_secret) VALUES (?, ?, ?, ?, ?, 0, 1, ?)",
-        (None, DEFAULT_ADMIN_USERNAME, "", "", "", pending_secret),
-    )
-    db.commit()
-    user = db.execute("SELECT id FROM users ORDER BY id LIMIT 1").fetchone()
-    session["user_id"] = user["id"]
+    with db:
+        user_id = db.execute(
+            "INSERT INTO users (email, username, password_hash, phone_number, country_code, must_update_credentials, is_admin, mfa_secret) VALUES (?, ?, ?, ?, ?, 0, 1, ?) RETURNING id",
+            (None, DEFAULT_ADMIN_USERNAME, "", "", "", pending_secret),
+        ).fetchone()[0]
+    _invalidate_user_count()
+    session["user_id"] = user_id
     session.pop("pending_mfa_secret", None)
     return jsonify({"redirect": "/app"})
 
 
-@app.route("/projects/<project_id>")
-@login_required
-def project_page(project_id: str):
-    init_db()
+@app.route("/projects/<int:project_id>")
+@login_required_html
+def project_page(project_id: int):
     project = require_project(project_id)
     return render_template("project.html", project=project)
 
-@app.route("/projects/<project_id>/dashboard")
-@login_required
-def project_dashboard(project_id: str):
-    init_db()
+@app.route("/projects/<int:project_id>/dashboard")
+@login_required_html
+def project_dashboard(project_id: int):
     project = require_project(project_id)
     return render_template("dashboard.html", project=project)
 
-@app.route("/projects/<project_id>/tool/<tool_key>")
-@login_required
-def project_tool_page(project_id: str, tool_key: str):
-    init_db()
+@app.route("/projects/<int:project_id>/tool/<tool_key>")
+@login_required_html
+def project_tool_page(project_id: int, tool_key: str):
     project = require_project(project_id)
     return render_template("tool.html", project=project, tool=tool_key)
 
 
 @app.route("/api/projects", methods=["GET"])
-@login_required
+@login_required_api
 def list_projects():
-    init_db()
-    db = get_db()
-    rows = db.execute("SELECT id, name, description FROM projects ORDER BY id DESC").fetchall()
-    return jsonify([dict(r) for r in rows])
+    if _wants_page():
+        return _keyset_page("projects", "id, name, description")
+
+    def load():
+        db = get_db()
+        rows = db.execute("SELECT id, name, description FROM projects ORDER BY id DESC").fetchall()
+        return orjson.dumps([dict(r) for r in rows])
+
+    return _json_bytes_response(_cached_list("projects", None, load))
 
 
 @app.route("/api/projects", methods=["POST"])
-@login_required
+@login_required_api
 def create_project():
-    init_db()
     data = request.get_json(silent=True) or {}
-    name = (data.get("name") or "").strip()
+    name = _get_str(data, "name")
     if not name:
         abort(400, "Project name is required.")
-    description = (data.get("description") or "").strip()
+    description = _get_str(data, "description")
 
     db = get_db()
-    cur = db.execute(
-        "INSERT INTO projects (name, description) VALUES (?, ?)", (name, description)
+    with db:
+        created = db.execute(
+            "INSERT INTO projects (name, description) VALUES (?, ?) RETURNING id, name, description",
+            (name, description),
+        ).fetchone()
+    _invalidate_list("projects", None)
+    return jsonify(dict(created)), 201
+
+
+@app.route("/api/projects/<int:project_id>", methods=["GET"])
+@login_required_api
+def get_project(project_id: int):
+    return _json_bytes_response(
+        _cached_list("project", project_id, lambda: orjson.dumps(require_project(project_id)))
     )
-    db.commit()
-    project_id = cur.lastrowid
-    return jsonify({"id": project_id, "name": name, "description": description}), 201
-
-
-@app.route("/api/projects/<project_id>", methods=["GET"])
-@login_required
-def get_project(project_id: str):
-    init_db()
-    project = require_project(project_id)
-    return jsonify(project)
-
-
-@app.route("/api/projects/<project_id>/tasks", methods=["GET"])
-@login_required
-def list_tasks(project_id: str):
-    init_db()
-    require_project(project_id)
-    db = get_db()
-    rows = db.execute(
-        """
-        SELECT id, project_id, title, description, status, due_date, parent_id
-        FROM tasks
-        WHERE project_id = ?
-        ORDER BY id
-        """,
-        (project_id,),
-    ).fetchall()
-    return jsonify([dict(r) for r in rows])
 
 
-@app.route("/api/projects/<project_id>/tasks", methods=["POST"])
-@login_required
-def create_task(project_id: str):
-    init_db()
-    require_project(project_id)
+@app.route("/api/projects/<int:project_id>/tasks", methods=["GET"])
+@login_required_api
+def list_tasks(project_id: int):
+    def load():
+        db = get_db()
+        rows = db.execute(
+            """
+            SELECT id, project_id, title, description, status, due_date, parent_id
+            FROM tasks
+            WHERE project_id = ?
+            ORDER BY id
+            """,
+            (project_id,),
+        ).fetchall()
+        return orjson.dumps([dict(r) for r in rows])
+
+    return _json_bytes_response(_cached_list("tasks", project_id, load))
+
+
+@app.route("/api/projects/<int:project_id>/tasks", methods=["POST"])
+@login_required_api
+def create_task(project_id: int):
     data = request.get_json(silent=True) or {}
-    title = (data.get("title") or "").strip()
-    if not title:
-        abort(400, "Task title is required.")
-    status = (data.get("status") or "todo").strip().lower()
-    if status not in {"todo", "in-progress", "done", "later"}:
-        status = "todo"
-    due_date = (data.get("due_date") or "").strip()
-    description = (data.get("description") or "").strip()
-    parent_id = data.get("parent_id")
-    if parent_id in ("", None):
-        parent_id = None
-    # Single-user mode: ignore assignee/resource
+    values = _task_values(data)
 
     db = get_db()
-    cur = db.execute(
-        "INSERT INTO tasks (project_id, title, description, status, due_date, parent_id) VALUES (?, ?, ?, ?, ?, ?)",
-        (project_id, title, description, status, due_date, parent_id),
-    )
-    db.commit()
-    task_id = cur.lastrowid
-    return (
-        jsonify(
-            {
-                "id": task_id,
-                "project_id": int(project_id),
-                "title": title,
-                "description": description,
-                "status": status,
-                "due_date": due_date,
-                "parent_id": parent_id,
-            }
-        ),
-        201,
-    )
+    try:
+        with db:
+            created = db.execute(
+                """
+                INSERT INTO tasks (project_id, title, description, status, due_date, parent_id) VALUES (?, ?, ?, ?, ?, ?)
+                RETURNING id, project_id, title, description, status, due_date, parent_id
+                """,
+                (project_id, *values),
+            ).fetchone()
+    except sqlite3.IntegrityError:
+        abort(404, "Project not found.")
+    _invalidate_list("tasks", project_id)
+    return jsonify(dict(created)), 201
 
 
-@app.route("/api/tasks/<task_id>", methods=["PATCH"])
-@login_required
-def update_task(task_id: str):
-    init_db()
-    db = get_db()
-    task = db.execute(
-        "SELECT id, project_id, title, description, status, due_date, parent_id FROM tasks WHERE id = ?",
-        (task_id,),
-    ).fetchone()
-    if not task:
-        abort(404, "Task not found.")
+@app.route("/api/projects/<int:project_id>/tasks/bulk", methods=["POST"])
+@login_required_api
+def bulk_create_tasks(project_id: int):
+    return _bulk_create("tasks", TASK_INSERT_COLUMNS, project_id, _task_values)
+
 
+@app.route("/api/tasks/<int:task_id>", methods=["PATCH"])
+@login_required_api
+def update_task(task_id: int):
     data = request.get_json(silent=True) or {}
+    fields = {}
     if "title" in data:
-        new_title = (data.get("title") or "").strip()
+        new_title = _get_str(data, "title")
         if new_title:
-            db.execute("UPDATE tasks SET title = ? WHERE id = ?", (new_title, task_id))
+            fields["title"] = new_title
     if "status" in data:
-        status = (data.get("status") or "").strip().lower()
-        if status in {"todo", "in-progress", "done", "later"}:
-            db.execute("UPDATE tasks SET status = ? WHERE id = ?", (status, task_id))
+        status = _get_enum(data, "status", TASK_STATUSES)
+        if status:
+            fields["status"] = status
     if "description" in data:
-        description = (data.get("description") or "").strip()
-        db.execute("UPDATE tasks SET description = ? WHERE id = ?", (description, task_id))
+        fields["description"] = _get_str(data, "description")
     if "due_date" in data:
-        due_date = (data.get("due_date") or "").strip()
-        db.execute("UPDATE tasks SET due_date = ? WHERE id = ?", (due_date, task_id))
+        fields["due_date"] = _get_str(data, "due_date")
     if "parent_id" in data:
-        parent_id = data.get("parent_id")
-        if parent_id in ("", None):
-            parent_id = None
-        db.execute("UPDATE tasks SET parent_id = ? WHERE id = ?", (parent_id, task_id))
+        fields["parent_id"] = _get_parent_id(data)
     # Ignore resource updates in single-user mode
 
-    db.commit()
-    updated = db.execute(
-        "SELECT id, project_id, title, description, status, due_date, parent_id FROM tasks WHERE id = ?",
-        (task_id,),
-    ).fetchone()
+    db = get_db()
+    if not fields:
+        task = db.execute(
+            "SELECT id, project_id, title, description, status, due_date, parent_id FROM tasks WHERE id = ?",
+            (task_id,),
+        ).fetchone()
+        if not task:
+            abort(404, "Task not found.")
+        return jsonify(dict(task))
+    sets = ", ".join(f"{k} = ?" for k in fields.keys())
+    with db:
+        updated = db.execute(
+            f"UPDATE tasks SET {sets} WHERE id = ? RETURNING id, project_id, title, description, status, due_date, parent_id",
+            (*fields.values(), task_id),
+        ).fetchone()
+        if updated is None:
+            abort(404, "Task not found.")
+    _invalidate_list("tasks", updated["project_id"])
     return jsonify(dict(updated))
 
 
-@app.route("/api/backlogs/<project_id>", methods=["GET"])
-@login_required
-def list_backlogs(project_id: str):
-    init_db()
-    require_project(project_id)
-    db = get_db()
-    rows = db.execute(
-        "SELECT id, project_id, title, priority, status, tags, parent_id FROM backlogs WHERE project_id = ? ORDER BY id DESC",
-        (project_id,),
-    ).fetchall()
-    return jsonify([dict(r) for r in rows])
+@app.route("/api/backlogs/<int:project_id>", methods=["GET"])
+@login_required_api
+def list_backlogs(project_id: int):
+    if _wants_page():
+        return _keyset_page("backlogs", "id, project_id, title, priority, status, tags, parent_id", project_id)
 
+    def load():
+        db = get_db()
+        rows = db.execute(
+            "SELECT id, project_id, title, priority, status, tags, parent_id FROM backlogs WHERE project_id = ? ORDER BY id DESC",
+            (project_id,),
+        ).fetchall()
+        return orjson.dumps([dict(r) for r in rows])
 
-@app.route("/api/backlogs/<project_id>", methods=["POST"])
-@login_required
-def create_backlog(project_id: str):
-    init_db()
-    require_project(project_id)
+    return _json_bytes_response(_cached_list("backlogs", project_id, load))
+
+
+@app.route("/api/backlogs/<int:project_id>", methods=["POST"])
+@login_required_api
+def create_backlog(project_id: int):
     data = request.get_json(silent=True) or {}
-    title = (data.get("title") or "").strip()
-    if not title:
-        abort(400, "Title is required.")
-    priority = (data.get("priority") or "medium").strip().lower()
-    if priority not in {"high", "medium", "low"}:
-        priority = "medium"
-    status = (data.get("status") or "todo").strip().lower()
-    if status not in {"in-progress", "todo", "later"}:
-        status = "todo"
-    tags = ",".join([t.strip() for t in (data.get("tags") or "").split(",") if t.strip()])
-    parent_id = data.get("parent_id")
-    if parent_id in ("", None):
-        parent_id = None
-    # Single-user mode: ignore assignee/resource
+    values = _backlog_values(data)
 
     db = get_db()
-    cur = db.execute(
-        "INSERT INTO backlogs (project_id, title, priority, status, tags, parent_id) VALUES (?, ?, ?, ?, ?, ?)",
-        (project_id, title, priority, status, tags, parent_id),
-    )
-    db.commit()
-    backlog_id = cur.lastrowid
-    return (
-        jsonify(
-            {
-                "id": backlog_id,
-                "project_id": int(project_id),
-                "title": title,
-                "priority": priority,
-                "status": status,
-                "tags": tags,
-                "parent_id": parent_id,
-            }
-        ),
-        201,
-    )
+    try:
+        with db:
+            created = db.execute(
+                """
+                INSERT INTO backlogs (project_id, title, priority, status, tags, parent_id) VALUES (?, ?, ?, ?, ?, ?)
+                RETURNING id, project_id, title, priority, status, tags, parent_id
+                """,
+                (project_id, *values),
+            ).fetchone()
+    except sqlite3.IntegrityError:
+        abort(404, "Project not found.")
+    _invalidate_list("backlogs", project_id)
+    return jsonify(dict(created)), 201
 
 
-@app.route("/api/backlog/<item_id>", methods=["PATCH"])
-@login_required
-def update_backlog(item_id: str):
-    init_db()
-    db = get_db()
-    row = db.execute(
-        "SELECT id, project_id, title, priority, status, tags, parent_id FROM backlogs WHERE id = ?",
-        (item_id,),
-    ).fetchone()
-    if not row:
-        abort(404, "Backlog item not found.")
+@app.route("/api/backlogs/<int:project_id>/bulk", methods=["POST"])
+@login_required_api
+def bulk_create_backlogs(project_id: int):
+    return _bulk_create("backlogs", BACKLOG_INSERT_COLUMNS, project_id, _backlog_values)
+
 
+@app.route("/api/backlog/<int:item_id>", methods=["PATCH"])
+@login_required_api
+def update_backlog(item_id: int):
     data = request.get_json(silent=True) or {}
     fields = {}
     if "title" in data:
-        title = (data.get("title") or "").strip()
+        title = _get_str(data, "title")
         if title:
             fields["title"] = title
     if "priority" in data:
-        priority = (data.get("priority") or "").strip().lower()
-        if priority in {"high", "medium", "low"}:
+        priority = _get_enum(data, "priority", BACKLOG_PRIORITIES)
+        if priority:
             fields["priority"] = priority
     if "status" in data:
-        status = (data.get("status") or "").strip().lower()
-        if status in {"in-progress", "todo", "later"}:
+        status = _get_enum(data, "status", BACKLOG_STATUSES)
+        if status:
             fields["status"] = status
     if "tags" in data:
-        tags = ",".join([t.strip() for t in (data.get("tags") or "").split(",") if t.strip()])
-        fields["tags"] = tags
+        fields["tags"] = _get_tags(data)
     if "parent_id" in data:
-        parent_id = data.get("parent_id")
-        if parent_id in ("", None):
-            parent_id = None
-        fields["parent_id"] = parent_id
+        fields["parent_id"] = _get_parent_id(data)
     # Ignore resource updates in single-user mode
 
-    if fields:
-        sets = ", ".join(f"{k} = ?" for k in fields.keys())
-        db.execute(f"UPDATE backlogs SET {sets} WHERE id = ?", (*fields.values(), item_id))
-        db.commit()
-
-    updated = db.execute(
-        "SELECT id, project_id, title, priority, status, tags, parent_id FROM backlogs WHERE id = ?",
-        (item_id,),
-    ).fetchone()
+    db = get_db()
+    if not fields:
+        row = db.execute(
+            "SELECT id, project_id, title, priority, status, tags, parent_id FROM backlogs WHERE id = ?",
+            (item_id,),
+        ).fetchone()
+        if not row:
+            abort(404, "Backlog item not found.")
+        return jsonify(dict(row))
+    sets = ", ".join(f"{k} = ?" for k in fields.keys())
+    with db:
+        updated = db.execute(
+            f"UPDATE backlogs SET {sets} WHERE id = ? RETURNING id, project_id, title, priority, status, tags, parent_id",
+            (*fields.values(), item_id),
+        ).fetchone()
+        if updated is None:
+            abort(404, "Backlog item not found.")
+    _invalidate_list("backlogs", updated["project_id"])
     return jsonify(dict(updated))
 
 
-@app.route("/api/backlog/<item_id>", methods=["DELETE"])
-@login_required
-def delete_backlog(item_id: str):
-    init_db()
+@app.route("/api/backlog/<int:item_id>", methods=["DELETE"])
+@login_required_api
+def delete_backlog(item_id: int):
     db = get_db()
-    exists = db.execute("SELECT id FROM backlogs WHERE id = ?", (item_id,)).fetchone()
-    if not exists:
-        abort(404, "Backlog item not found.")
-    db.execute("DELETE FROM backlogs WHERE id = ?", (item_id,))
-    db.commit()
+    with db:
+        deleted = db.execute("DELETE FROM backlogs WHERE id = ? RETURNING project_id", (item_id,)).fetchone()
+        if deleted is None:
+            abort(404, "Backlog item not found.")
+    _invalidate_list("backlogs", deleted["project_id"])
     return "", 204
 
 
-@app.route("/api/sprints/<project_id>", methods=["GET"])
-@login_required
-def list_sprints(project_id: str):
-    init_db()
-    require_project(project_id)
-    db = get_db()
-    rows = db.execute(
-        """
-        SELECT id, project_id, name, status, start_date, end_date, velocity, scope_points, done_points, notes
-        FROM sprints
-        WHERE project_id = ?
-        ORDER BY id DESC
-        """,
-        (project_id,),
-    ).fetchall()
-    return jsonify([dict(r) for r in rows])
+@app.route("/api/sprints/<int:project_id>", methods=["GET"])
+@login_required_api
+def list_sprints(project_id: int):
+    if _wants_page():
+        return _keyset_page("sprints", "id, project_id, name, status, start_date, end_date, velocity, scope_points, done_points, notes", project_id)
 
+    def load():
+        db = get_db()
+        rows = db.execute(
+            """
+            SELECT id, project_id, name, status, start_date, end_date, velocity, scope_points, done_points, notes
+            FROM sprints
+            WHERE project_id = ?
+            ORDER BY id DESC
+            """,
+            (project_id,),
+        ).fetchall()
+        return orjson.dumps([dict(r) for r in rows])
 
-@app.route("/api/sprints/<project_id>", methods=["POST"])
-@login_required
-def create_sprint(project_id: str):
-    init_db()
-    require_project(project_id)
+    return _json_bytes_response(_cached_list("sprints", project_id, load))
+
+
+@app.route("/api/sprints/<int:project_id>", methods=["POST"])
+@login_required_api
+def create_sprint(project_id: int):
     data = request.get_json(silent=True) or {}
-    name = (data.get("name") or "").strip()
-    if not name:
-        abort(400, "Sprint name is required.")
-    status = (data.get("status") or "planned").strip().lower()
-    if status not in {"planned", "active", "done"}:
-        status = "planned"
-    start_date = (data.get("start_date") or "").strip()
-    end_date = (data.get("end_date") or "").strip()
-    velocity = int(data.get("velocity") or 0)
-    scope_points = int(data.get("scope_points") or 0)
-    done_points = int(data.get("done_points") or 0)
-    notes = (data.get("notes") or "").strip()
+    values = _sprint_values(data)
 
     db = get_db()
-    cur = db.execute(
-        """
-        INSERT INTO sprints (project_id, name, status, start_date, end_date, velocity, scope_points, done_points, notes)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (project_id, name, status, start_date, end_date, velocity, scope_points, done_points, notes),
-    )
-    db.commit()
-    sprint_id = cur.lastrowid
-    return (
-        jsonify(
-            {
-                "id": sprint_id,
-                "project_id": int(project_id),
-                "name": name,
-                "status": status,
-                "start_date": start_date,
-                "end_date": end_date,
-                "velocity": velocity,
-                "scope_points": scope_points,
-                "done_points": done_points,
-                "notes": notes,
-            }
-        ),
-        201,
-    )
+    try:
+        with db:
+            created = db.execute(
+                """
+                INSERT INTO sprints (project_id, name, status, start_date, end_date, velocity, scope_points, done_points, notes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING id, project_id, name, status, start_date, end_date, velocity, scope_points, done_points, notes
+                """,
+                (project_id, *values),
+            ).fetchone()
+    except sqlite3.IntegrityError:
+        abort(404, "Project not found.")
+    _invalidate_list("sprints", project_id)
+    return jsonify(dict(created)), 201
 
 
-@app.route("/api/sprint/<sprint_id>", methods=["PATCH"])
-@login_required
-def update_sprint(sprint_id: str):
-    init_db()
-    db = get_db()
-    row = db.execute(
-        """
-        SELECT id, project_id, name, status, start_date, end_date, velocity, scope_points, done_points, notes
-        FROM sprints WHERE id = ?
-        """,
-        (sprint_id,),
-    ).fetchone()
-    if not row:
-        abort(404, "Sprint not found.")
+@app.route("/api/sprints/<int:project_id>/bulk", methods=["POST"])
+@login_required_api
+def bulk_create_sprints(project_id: int):
+    return _bulk_create("sprints", SPRINT_INSERT_COLUMNS, project_id, _sprint_values)
+
 
+@app.route("/api/sprint/<int:sprint_id>", methods=["PATCH"])
+@login_required_api
+def update_sprint(sprint_id: int):
     data = request.get_json(silent=True) or {}
     fields = {}
     if "name" in data:
-        name = (data.get("name") or "").strip()
+        name = _get_str(data, "name")
         if name:
             fields["name"] = name
     if "status" in data:
-        status = (data.get("status") or "").strip().lower()
-        if status in {"planned", "active", "done"}:
+        status = _get_enum(data, "status", SPRINT_STATUSES)
+        if status:
             fields["status"] = status
     if "start_date" in data:
-        fields["start_date"] = (data.get("start_date") or "").strip()
+        fields["start_date"] = _get_str(data, "start_date")
     if "end_date" in data:
-        fields["end_date"] = (data.get("end_date") or "").strip()
+        fields["end_date"] = _get_str(data, "end_date")
     if "velocity" in data:
         fields["velocity"] = int(data.get("velocity") or 0)
     if "scope_points" in data:
@@ -1225,138 +1679,157 @@ def update_sprint(sprint_id: str):
     if "done_points" in data:
         fields["done_points"] = int(data.get("done_points") or 0)
     if "notes" in data:
-        fields["notes"] = (data.get("notes") or "").strip()
-
-    if fields:
-        sets = ", ".join(f"{k} = ?" for k in fields.keys())
-        db.execute(f"UPDATE sprints SET {sets} WHERE id = ?", (*fields.values(), sprint_id))
-        db.commit()
+        fields["notes"] = _get_str(data, "notes")
 
-    updated = db.execute(
-        """
-        SELECT id, project_id, name, status, start_date, end_date, velocity, scope_points, done_points, notes
-        FROM sprints WHERE id = ?
-        """,
-        (sprint_id,),
-    ).fetchone()
+    db = get_db()
+    if not fields:
+        row = db.execute(
+            """
+            SELECT id, project_id, name, status, start_date, end_date, velocity, scope_points, done_points, notes
+            FROM sprints WHERE id = ?
+            """,
+            (sprint_id,),
+        ).fetchone()
+        if not row:
+            abort(404, "Sprint not found.")
+        return jsonify(dict(row))
+    sets = ", ".join(f"{k} = ?" for k in fields.keys())
+    with db:
+        updated = db.execute(
+            f"""
+            UPDATE sprints SET {sets} WHERE id = ?
+            RETURNING id, project_id, name, status, start_date, end_date, velocity, scope_points, done_points, notes
+            """,
+            (*fields.values(), sprint_id),
+        ).fetchone()
+        if updated is None:
+            abort(404, "Sprint not found.")
+    _invalidate_list("sprints", updated["project_id"])
     return jsonify(dict(updated))
 
 
-@app.route("/api/sprint/<sprint_id>", methods=["DELETE"])
-@login_required
-def delete_sprint(sprint_id: str):
-    init_db()
+@app.route("/api/sprint/<int:sprint_id>", methods=["DELETE"])
+@login_required_api
+def delete_sprint(sprint_id: int):
     db = get_db()
-    exists = db.execute("SELECT id FROM sprints WHERE id = ?", (sprint_id,)).fetchone()
-    if not exists:
-        abort(404, "Sprint not found.")
-    db.execute("DELETE FROM sprints WHERE id = ?", (sprint_id,))
-    db.commit()
+    with db:
+        deleted = db.execute("DELETE FROM sprints WHERE id = ? RETURNING project_id", (sprint_id,)).fetchone()
+        if deleted is None:
+            abort(404, "Sprint not found.")
+    _invalidate_list("sprints", deleted["project_id"])
     return "", 204
 
 
-@app.route("/api/resources/<project_id>", methods=["GET"])
-@login_required
-def list_resources(project_id: str):
-    init_db()
-    require_project(project_id)
-    db = get_db()
-    rows = db.execute(
-        "SELECT id, project_id, name, status, notes FROM resources WHERE project_id = ? ORDER BY id DESC",
-        (project_id,),
-    ).fetchall()
-    return jsonify([dict(r) for r in rows])
+@app.route("/api/resources/<int:project_id>", methods=["GET"])
+@login_required_api
+def list_resources(project_id: int):
+    if _wants_page():
+        return _keyset_page("resources", "id, project_id, name, status, notes", project_id)
 
+    def load():
+        db = get_db()
+        rows = db.execute(
+            "SELECT id, project_id, name, status, notes FROM resources WHERE project_id = ? ORDER BY id DESC",
+            (project_id,),
+        ).fetchall()
+        return orjson.dumps([dict(r) for r in rows])
 
-@app.route("/api/resources/<project_id>", methods=["POST"])
-@login_required
-def create_resource(project_id: str):
-    init_db()
-    require_project(project_id)
+    return _json_bytes_response(_cached_list("resources", project_id, load))
+
+
+@app.route("/api/resources/<int:project_id>", methods=["POST"])
+@login_required_api
+def create_resource(project_id: int):
     data = request.get_json(silent=True) or {}
-    name = (data.get("name") or "").strip()
-    if not name:
-        abort(400, "Resource name is required.")
-    status = (data.get("status") or "free").strip().lower()
-    if status not in {"free", "overloaded", "holiday"}:
-        status = "free"
-    notes = (data.get("notes") or "").strip()
+    values = _resource_values(data)
     db = get_db()
-    cur = db.execute(
-        "INSERT INTO resources (project_id, name, status, notes) VALUES (?, ?, ?, ?)",
-        (project_id, name, status, notes),
-    )
-    db.commit()
-    resource_id = cur.lastrowid
-    return jsonify({"id": resource_id, "project_id": int(project_id), "name": name, "status": status, "notes": notes}), 201
+    try:
+        with db:
+            created = db.execute(
+                "INSERT INTO resources (project_id, name, status, notes) VALUES (?, ?, ?, ?) RETURNING id, project_id, name, status, notes",
+                (project_id, *values),
+            ).fetchone()
+    except sqlite3.IntegrityError:
+        abort(404, "Project not found.")
+    _invalidate_list("resources", project_id)
+    return jsonify(dict(created)), 201
 
 
-@app.route("/api/resource/<resource_id>", methods=["PATCH"])
-@login_required
-def update_resource(resource_id: str):
-    init_db()
-    db = get_db()
-    row = db.execute(
-        "SELECT id, project_id, name, status, notes FROM resources WHERE id = ?", (resource_id,)
-    ).fetchone()
-    if not row:
-        abort(404, "Resource not found.")
+@app.route("/api/resources/<int:project_id>/bulk", methods=["POST"])
+@login_required_api
+def bulk_create_resources(project_id: int):
+    return _bulk_create("resources", RESOURCE_INSERT_COLUMNS, project_id, _resource_values)
 
+
+@app.route("/api/resource/<int:resource_id>", methods=["PATCH"])
+@login_required_api
+def update_resource(resource_id: int):
     data = request.get_json(silent=True) or {}
     fields = {}
     if "name" in data:
-        name = (data.get("name") or "").strip()
+        name = _get_str(data, "name")
         if name:
             fields["name"] = name
     if "status" in data:
-        status = (data.get("status") or "").strip().lower()
-        if status in {"free", "overloaded", "holiday"}:
+        status = _get_enum(data, "status", RESOURCE_STATUSES)
+        if status:
             fields["status"] = status
     if "notes" in data:
-        fields["notes"] = (data.get("notes") or "").strip()
-
-    if fields:
-        sets = ", ".join(f"{k} = ?" for k in fields.keys())
-        db.execute(f"UPDATE resources SET {sets} WHERE id = ?", (*fields.values(), resource_id))
-        db.commit()
+        fields["notes"] = _get_str(data, "notes")
 
-    updated = db.execute(
-        "SELECT id, project_id, name, status, notes FROM resources WHERE id = ?", (resource_id,)
-    ).fetchone()
+    db = get_db()
+    if not fields:
+        row = db.execute(
+            "SELECT id, project_id, name, status, notes FROM resources WHERE id = ?", (resource_id,)
+        ).fetchone()
+        if not row:
+            abort(404, "Resource not found.")
+        return jsonify(dict(row))
+    sets = ", ".join(f"{k} = ?" for k in fields.keys())
+    with db:
+        updated = db.execute(
+            f"UPDATE resources SET {sets} WHERE id = ? RETURNING id, project_id, name, status, notes",
+            (*fields.values(), resource_id),
+        ).fetchone()
+        if updated is None:
+            abort(404, "Resource not found.")
+    _invalidate_list("resources", updated["project_id"])
     return jsonify(dict(updated))
 
 
-@app.route("/api/resource/<resource_id>", methods=["DELETE"])
-@login_required
-def delete_resource(resource_id: str):
-    init_db()
+@app.route("/api/resource/<int:resource_id>", methods=["DELETE"])
+@login_required_api
+def delete_resource(resource_id: int):
     db = get_db()
-    exists = db.execute("SELECT id FROM resources WHERE id = ?", (resource_id,)).fetchone()
-    if not exists:
-        abort(404, "Resource not found.")
-    db.execute("DELETE FROM resources WHERE id = ?", (resource_id,))
-    db.commit()
+    with db:
+        deleted = db.execute("DELETE FROM resources WHERE id = ? RETURNING project_id", (resource_id,)).fetchone()
+        if deleted is None:
+            abort(404, "Resource not found.")
+    _invalidate_list("resources", deleted["project_id"])
     return "", 204
 
-@app.route("/api/tasks/<task_id>", methods=["DELETE"])
-@login_required
-def delete_task(task_id: str):
-    init_db()
+@app.route("/api/tasks/<int:task_id>", methods=["DELETE"])
+@login_required_api
+def delete_task(task_id: int):
     db = get_db()
-    exists = db.execute("SELECT id FROM tasks WHERE id = ?", (task_id,)).fetchone()
-    if not exists:
-        abort(404, "Task not found.")
-    db.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-    db.commit()
+    with db:
+        deleted = db.execute("DELETE FROM tasks WHERE id = ? RETURNING project_id", (task_id,)).fetchone()
+        if deleted is None:
+            abort(404, "Task not found.")
+    _invalidate_list("tasks", deleted["project_id"])
     return "", 204
 
 
 if __name__ == "__main__":
     with app.app_context():
-        init_db()
         _maybe_reset_database_for_demo()
         _schedule_daily_reset()
     port = int(os.environ.get("PORT", "51005") or "51005")
-    app.run(host="0.0.0.0", port=port, debug=True)
+    if os.environ.get("FLASK_DEBUG", "0") not in {"0", "false", "False"}:
+        app.run(host="0.0.0.0", port=port, debug=True)
+    else:
+        from waitress import serve
+
+        serve(app, host="0.0.0.0", port=port, threads=int(os.environ.get("WAITRESS_THREADS") or 16))
 
 
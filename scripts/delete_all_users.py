@@ -29,13 +29,19 @@ try:
     cur = conn.cursor()
     # Disable foreign key constraints if present to allow cascade-like behavior
     cur.execute("PRAGMA foreign_keys = OFF;")
-    # Wipe all users
-    cur.execute("DELETE FROM users;")
-    conn.commit()
+    # Wipe all users in one explicit transaction
+    with conn:
+        cur.execute("DELETE FROM users;")
     print("All users deleted.")
 except Exception as e:
     print(f"Error deleting users: {e}")
     sys.exit(1)
+else:
+    # Hand the freed pages back; the users are already gone if this fails (e.g. app running)
+    try:
+        cur.execute("VACUUM;")
+    except Exception as e:
+        print(f"Warning: could not vacuum database: {e}")
 finally:
     try:
         conn.close()